@@ -5,9 +5,11 @@ Defines all agents for the Communication Coach system using Google ADK.
 """
 
 import os
-from google.adk.agents import Agent, SequentialAgent, ParallelAgent
+from typing import List
+from google.adk.agents import Agent
 from google.adk.models.google_llm import Gemini
 from google.adk.tools import google_search
+from pydantic import BaseModel
 from tools import vision_tool, voice_tool, language_tool
 
 # Ensure API key is configured
@@ -17,14 +19,18 @@ if not os.getenv('GEMINI_API_KEY'):
         "Set it via: export GEMINI_API_KEY='your-key'"
     )
 
+# One model instance for every agent: a single genai client, credential
+# lookup and connection pool instead of one per agent
+GEMINI_PRO = Gemini(model_name="gemini-1.5-pro")
+
 
 # ============================================================================
-# ANALYSIS AGENTS (Sequential Pipeline)
+# ANALYSIS AGENTS (Vision + Voice in parallel, then Language)
 # ============================================================================
 
 vision_agent = Agent(
     name="VisionAgent",
-    model=Gemini(model_name="gemini-1.5-pro"),
+    model=GEMINI_PRO,
     tools=[vision_tool],
     instructions="""
     You are a vision analysis specialist for interview coaching.
@@ -46,7 +52,7 @@ vision_agent = Agent(
 
 voice_agent = Agent(
     name="VoiceAgent",
-    model=Gemini(model_name="gemini-1.5-pro"),
+    model=GEMINI_PRO,
     tools=[voice_tool],
     instructions="""
     You are a voice analysis specialist for interview coaching.
@@ -69,7 +75,7 @@ voice_agent = Agent(
 
 language_agent = Agent(
     name="LanguageAgent",
-    model=Gemini(model_name="gemini-1.5-pro"),
+    model=GEMINI_PRO,
     tools=[language_tool],
     instructions="""
     You are a language analysis specialist for interview coaching.
@@ -86,8 +92,8 @@ language_agent = Agent(
     - Sentence statistics
     - Vocabulary diversity
     
-    If transcript exceeds 2000 tokens, use context compaction to focus on
-    key patterns rather than analyzing every sentence.
+    Long transcripts arrive already windowed to their most recent 2000
+    tokens; analyze the text you receive without summarizing it further.
     
     Be analytical and evidence-based.
     """
@@ -95,37 +101,22 @@ language_agent = Agent(
 
 
 # ============================================================================
-# SEQUENTIAL ANALYSIS PIPELINE
+# COACHING AGENTS (run concurrently by run_coaching_session)
 # ============================================================================
 
-analysis_pipeline = SequentialAgent(
-    name="AnalysisPipeline",
-    agents=[vision_agent, voice_agent, language_agent],
-    instructions="""
-    You coordinate the multi-modal analysis pipeline.
-    
-    Execution flow:
-    1. VisionAgent processes video → vision metrics
-    2. VoiceAgent processes audio → transcript + voice metrics
-    3. LanguageAgent processes transcript → language metrics
-    
-    Context management:
-    - Pass outputs sequentially between agents
-    - If context exceeds 2000 tokens, trigger compaction
-    - Maintain all numeric metrics without loss
-    
-    Output: Combined dictionary of vision, voice, and language results.
-    """
-)
+class CoachingReport(BaseModel):
+    """Structured aggregator output: every sub-task in one response."""
+    feedback: List[str]
+    strengths: List[str]
+    weaknesses: List[str]
+    priorities: List[str]
 
 
-# ============================================================================
-# COACHING AGENTS (Parallel)
-# ============================================================================
-
 aggregator_agent = Agent(
     name="AggregatorAgent",
-    model=Gemini(model_name="gemini-1.5-pro"),
+    model=GEMINI_PRO,
+    # One structured response covers the whole report (single request)
+    output_schema=CoachingReport,
     instructions="""
     You are an expert communication coach aggregating multi-modal analysis.
     
@@ -145,15 +136,19 @@ aggregator_agent = Agent(
     - Medium impact: Vocal energy, sentence structure
     - Context-dependent: Facial expressions, pitch variation
     
-    If prior session data is available in memory, highlight progress.
-    
-    Output: 3-5 prioritized feedback points with specific metrics.
+    Answer every section in a single JSON response:
+    {
+        "feedback": [3-5 prioritized feedback points with specific metrics],
+        "strengths": [top 3 strengths],
+        "weaknesses": [top 3 areas for improvement],
+        "priorities": [top 3 focus areas, highest impact first]
+    }
     """
 )
 
 recommender_agent = Agent(
     name="RecommenderAgent",
-    model=Gemini(model_name="gemini-1.5-pro"),
+    model=GEMINI_PRO,
     tools=[google_search],
     instructions="""
     You are a personalized exercise recommender for communication skills.
@@ -181,35 +176,6 @@ recommender_agent = Agent(
 )
 
 
-# ============================================================================
-# PARALLEL COACH AGENT
-# ============================================================================
-
-coach = ParallelAgent(
-    name="CoachAgent",
-    agents=[aggregator_agent, recommender_agent],
-    instructions="""
-    You orchestrate personalized coaching by running analysis aggregation
-    and exercise recommendation in parallel.
-    
-    Workflow:
-    1. AggregatorAgent creates prioritized feedback (runs in parallel)
-    2. RecommenderAgent searches for exercises (runs in parallel)
-    3. Merge outputs into comprehensive coaching report
-    
-    Final output structure:
-    {
-        "feedback": [list of prioritized feedback points],
-        "recommendations": [list of exercises with descriptions],
-        "strengths": [identified strengths],
-        "priorities": [top 3 focus areas]
-    }
-    
-    Ensure outputs are complementary and reference each other where relevant.
-    """
-)
-
-
 # ============================================================================
 # EXPORT ALL AGENTS
 # ============================================================================
@@ -218,8 +184,6 @@ __all__ = [
     'vision_agent',
     'voice_agent', 
     'language_agent',
-    'analysis_pipeline',
     'aggregator_agent',
-    'recommender_agent',
-    'coach'
+    'recommender_agent'
 ]
\ No newline at end of file
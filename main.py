@@ -6,6 +6,7 @@ Main script for running multi-agent communication coaching sessions.
 
 import os
 import sys
+import asyncio
 import logging
 import argparse
 from datetime import datetime
@@ -20,8 +21,21 @@ from google.adk.memory import MemoryBank
 from google.adk.evaluation import AgentEvaluator
 
 # Import our agents
-from agents import analysis_pipeline, coach
-from tools import vision_analyze, voice_analyze, language_analyze
+from agents import (
+    vision_agent,
+    voice_agent,
+    language_agent,
+    aggregator_agent,
+    recommender_agent
+)
+from tools import (
+    vision_analyze,
+    voice_analyze,
+    language_analyze,
+    preprocess_media,
+    release_media,
+    compact
+)
 
 # Configure logging for observability
 logging.basicConfig(
@@ -71,11 +85,71 @@ evaluator = AgentEvaluator(
 )
 
 
+def memory_get(cache: dict, user_id: str, key: str):
+    """
+    Read from the memory bank, memoized in a request-scoped cache.
+    
+    Args:
+        cache: Dictionary owned by the current coaching session
+        user_id: User whose memory is read
+        key: Memory key to retrieve
+        
+    Returns:
+        The stored value (repeat reads within a session hit the cache)
+    """
+    if key not in cache:
+        cache[key] = memory_bank.retrieve(user_id, key)
+    return cache[key]
+
+
+# ============================================================================
+# ANALYSIS ORCHESTRATION
+# ============================================================================
+
+async def run_analysis(session, analysis_input: dict) -> dict:
+    """
+    Run the multi-modal analysis as a dependency graph.
+    
+    Vision and voice only depend on the input file, so they run
+    concurrently. Language depends on the voice transcript and starts as
+    soon as voice finishes, making the critical path
+    max(vision, voice) + language.
+    
+    Args:
+        session: Active ADK session
+        analysis_input: Dictionary with video_path and audio_path
+        
+    Returns:
+        Dictionary with vision_analysis, voice_analysis and
+        language_analysis results
+    """
+    vision_fut = asyncio.create_task(
+        runner.run_async(vision_agent, session, analysis_input)
+    )
+    voice_fut = asyncio.create_task(
+        runner.run_async(voice_agent, session, analysis_input)
+    )
+    vision_res, voice_res = await asyncio.gather(vision_fut, voice_fut)
+    
+    transcript = (voice_res or {}).get("transcript", "")
+    language_res = await runner.run_async(
+        language_agent,
+        session,
+        {"transcript": compact(transcript)}
+    )
+    
+    return {
+        'vision_analysis': vision_res or {},
+        'voice_analysis': voice_res or {},
+        'language_analysis': language_res or {}
+    }
+
+
 # ============================================================================
 # CORE COACHING SESSION FUNCTION
 # ============================================================================
 
-def run_coaching_session(
+async def run_coaching_session(
     video_path: str,
     user_id: str = "user1",
     session_id: str = None,
@@ -122,12 +196,16 @@ def run_coaching_session(
         session = session_service.create_session(user_id=user_id)
         logger.info(f"Session created: {session.id}")
         
+        # Memory-bank reads are memoized for the lifetime of this session
+        memory_cache = {}
+        
         # ====================================================================
-        # STEP 2: SEQUENTIAL ANALYSIS PIPELINE
+        # STEP 2: MULTI-MODAL ANALYSIS (vision || voice → language)
         # ====================================================================
         if verbose:
             print("\n🔍 Running multi-modal analysis...")
             print("  ├─ Vision: Analyzing facial expressions...")
+            print("  ├─ Voice: Transcribing and analyzing audio...")
         
         # Prepare input for analysis pipeline
         analysis_input = {
@@ -135,16 +213,21 @@ def run_coaching_session(
             "audio_path": video_path  # Most video formats contain audio
         }
         
-        # Run sequential analysis (vision → voice → language)
+        # Start decoding frames and audio once in the background; both tools
+        # wait on the shared buffers while the agents' first turns proceed
+        try:
+            preprocess_media(video_path)
+        except Exception as e:
+            logger.warning(f"Media preprocessing failed, tools will decode: {e}")
+        
+        # Run vision and voice concurrently, then language on the transcript
         logger.info("Running analysis pipeline")
-        analysis_results = runner.run(
-            analysis_pipeline,
-            session,
-            analysis_input
-        )
+        try:
+            analysis_results = await run_analysis(session, analysis_input)
+        finally:
+            release_media(video_path)
         
         if verbose:
-            print("  ├─ Voice: Transcribing and analyzing audio...")
             print("  └─ Language: Analyzing linguistic patterns...")
             print("  ✓ Analysis complete!")
         
@@ -158,9 +241,29 @@ def run_coaching_session(
             print("  ├─ Aggregating feedback...")
             print("  └─ Searching for practice exercises...")
         
-        # Run parallel coaching agents
-        coach_input = analysis_results
-        coach_results = runner.run(coach, session, coach_input)
+        # Metrics pass through verbatim; only the free-text transcript is
+        # windowed to keep the coaching context bounded
+        voice_results = analysis_results.get('voice_analysis', {})
+        coach_input = {
+            **analysis_results,
+            'voice_analysis': {
+                **voice_results,
+                'transcript': compact(voice_results.get('transcript', ''))
+            }
+        }
+        
+        # Fan out both coaching agents so latency tracks the slower call
+        # rather than the sum of the two Gemini round-trips
+        feedback_task = asyncio.create_task(
+            runner.run_async(aggregator_agent, session, coach_input)
+        )
+        rec_task = asyncio.create_task(
+            runner.run_async(recommender_agent, session, coach_input)
+        )
+        agg, rec = await asyncio.gather(feedback_task, rec_task)
+        
+        # Fan in: merge feedback and recommendations into one report
+        coach_results = {**(agg or {}), **(rec or {})}
         
         if verbose:
             print("  ✓ Coaching complete!")
@@ -209,7 +312,7 @@ def run_coaching_session(
         
         try:
             # Retrieve previous session data
-            prior_data = memory_bank.retrieve(user_id, "prior_metrics")
+            prior_data = memory_get(memory_cache, user_id, "prior_metrics")
             
             if prior_data:
                 prior_voice = prior_data.get('voice', {})
@@ -249,6 +352,7 @@ def run_coaching_session(
             'feedback': coach_results.get('feedback', []),
             'recommendations': coach_results.get('recommendations', []),
             'strengths': coach_results.get('strengths', []),
+            'weaknesses': coach_results.get('weaknesses', []),
             'priorities': coach_results.get('priorities', []),
             
             # Meta information
@@ -308,12 +412,12 @@ def main():
     
     # Run coaching session
     try:
-        results = run_coaching_session(
+        results = asyncio.run(run_coaching_session(
             video_path=args.video,
             user_id=args.user,
             session_id=args.session,
             verbose=not args.quiet
-        )
+        ))
         
         # Print summary
         print("\n" + "="*60)
@@ -4,30 +4,365 @@ Custom Analysis Tools for Communication Coach
 Provides vision, voice, and language analysis tools wrapped as ADK FunctionTools.
 """
 
+import os
+import asyncio
+import platform
+import hashlib
+import queue
+import functools
 import cv2
-import whisper
 import librosa
 import numpy as np
+import torch
+import torchaudio
 import spacy
 import re
-from transformers import pipeline
+from transformers import AutoTokenizer, pipeline
+from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+from optimum.onnxruntime.configuration import AutoQuantizationConfig
+from faster_whisper import WhisperModel, decode_audio
+from diskcache import Cache
+from concurrent.futures import ThreadPoolExecutor
 from google.adk.tools import FunctionTool
 
-# Initialize models globally to avoid reloading
-print("Loading models... This may take a minute on first run.")
-nlp = spacy.load("en_core_web_sm")
-emotion_pipeline = pipeline(
-    "text-classification",
-    model="j-hartmann/emotion-english-distilroberta-base"
-)
-whisper_model = whisper.load_model("base")
-print("Models loaded successfully!")
+# ============================================================================
+# MODEL LOADING (background warm start)
+# ============================================================================
+
+def _load_nlp():
+    """Loads spaCy for sentence splitting only (no tagger/parser/NER)."""
+    nlp = spacy.load(
+        "en_core_web_sm",
+        disable=["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner"]
+    )
+    nlp.add_pipe("sentencizer")
+    return nlp
+
+
+def _load_whisper():
+    """Loads CTranslate2 Whisper: int8 on CPU, fp16 on GPU."""
+    on_gpu = torch.cuda.is_available()
+    return WhisperModel(
+        "base",
+        device="cuda" if on_gpu else "cpu",
+        compute_type="float16" if on_gpu else "int8"
+    )
+
+
+SENTIMENT_MODEL = "distilbert-base-uncased-finetuned-sst-2-english"
+EMOTION_MODEL = "j-hartmann/emotion-english-distilroberta-base"
+
+# Int8 ONNX exports of the classifiers, built once on first run
+INT8_MODEL_DIR = "./.cc_models"
+
+
+def _load_int8_classifier(task: str, model_id: str):
+    """
+    Loads a text classifier as an int8-quantized ONNX Runtime pipeline.
+    
+    The model is exported to ONNX and dynamically quantized on first use
+    (AVX512-VNNI on x86, dot-product kernels on ARM), then reused from
+    INT8_MODEL_DIR on later runs.
+    """
+    save_dir = os.path.join(INT8_MODEL_DIR, model_id.replace("/", "--") + "-int8")
+    quantized_file = "model_quantized.onnx"
+    
+    if not os.path.exists(os.path.join(save_dir, quantized_file)):
+        model = ORTModelForSequenceClassification.from_pretrained(
+            model_id, export=True
+        )
+        AutoTokenizer.from_pretrained(model_id).save_pretrained(save_dir)
+        
+        if platform.machine().lower() in ("arm64", "aarch64"):
+            qconfig = AutoQuantizationConfig.arm64(
+                is_static=False, per_channel=False
+            )
+        else:
+            qconfig = AutoQuantizationConfig.avx512_vnni(
+                is_static=False, per_channel=False
+            )
+        ORTQuantizer.from_pretrained(model).quantize(
+            save_dir=save_dir, quantization_config=qconfig
+        )
+    
+    model = ORTModelForSequenceClassification.from_pretrained(
+        save_dir, file_name=quantized_file
+    )
+    tokenizer = AutoTokenizer.from_pretrained(save_dir)
+    return pipeline(task, model=model, tokenizer=tokenizer)
+
+
+def _load_classifier(task: str, model_id: str):
+    """Text classifier: FP16 torch on GPU, int8 ONNX on CPU."""
+    if torch.cuda.is_available():
+        return pipeline(
+            task, model=model_id, device=0, torch_dtype=torch.float16
+        )
+    return _load_int8_classifier(task, model_id)
+
+
+def _load_sentiment():
+    return _load_classifier("sentiment-analysis", SENTIMENT_MODEL)
+
+
+def _load_emotion():
+    return _load_classifier("text-classification", EMOTION_MODEL)
+
+
+def _report_loaded():
+    failed = False
+    for f in _model_futures:
+        if f.exception() is not None:
+            print(f"Model loading error: {f.exception()}")
+            failed = True
+    if not failed:
+        print("Models loaded successfully!")
+
+
+# Initialize models once, off the import path, so startup work (API
+# configuration, session setup, video validation) overlaps with loading.
+# Whisper is queued first since voice analysis needs it earliest. The
+# emotion model has no caller yet, so it is only loaded on first use.
+print("Loading models in the background...")
+_loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="model-loader")
+_whisper_f = _loader.submit(_load_whisper)
+_sentiment_f = _loader.submit(_load_sentiment)
+_nlp_f = _loader.submit(_load_nlp)
+_model_futures = (_whisper_f, _sentiment_f, _nlp_f)
+_loader.submit(_report_loaded)
+
+
+@functools.lru_cache(maxsize=None)
+def _whisper_model():
+    return _whisper_f.result()
+
+
+@functools.lru_cache(maxsize=None)
+def _sentiment_pipeline():
+    return _sentiment_f.result()
+
+
+@functools.lru_cache(maxsize=None)
+def _nlp():
+    return _nlp_f.result()
+
+
+@functools.lru_cache(maxsize=None)
+def _emotion_pipeline():
+    return _load_emotion()
+
+
+# ============================================================================
+# ANALYSIS CACHE
+# ============================================================================
+
+# Results keyed by input content, so re-running the same file is a lookup
+analysis_cache = Cache("./.cc_cache")
+
+# Part of every cache key: bump whenever any analysis result changes
+# meaning or shape, so stale entries in .cc_cache are never returned
+ANALYSIS_CACHE_VERSION = 1
+
+
+def _file_key(path: str) -> str:
+    """Cheap content fingerprint: first 1MB of the file plus its size."""
+    with open(path, 'rb') as f:
+        head = f.read(1 << 20)
+    size = str(os.path.getsize(path)).encode()
+    return hashlib.blake2b(head + size).hexdigest()
+
+
+def _text_key(text: str) -> str:
+    """Fingerprint for short, deterministic text inputs."""
+    return hashlib.sha1(text.encode()).hexdigest()
+
+
+def _cache_key(name: str, content_key: str) -> tuple:
+    """Cache key for an analysis function's result on given content."""
+    return (ANALYSIS_CACHE_VERSION, name, content_key)
+
+
+def cached_analysis(key_fn):
+    """
+    Memoizes an analysis function on disk by the content of its input.
+    
+    Args:
+        key_fn: Maps the function's single input to a content key
+        
+    Failed analyses (results containing 'error') are not cached.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            source = args[0] if args else next(iter(kwargs.values()))
+            try:
+                key = _cache_key(func.__name__, key_fn(source))
+            except (OSError, AttributeError):
+                # Unreadable input: let the analysis report the error
+                return func(*args, **kwargs)
+            
+            result = analysis_cache.get(key)
+            if result is not None:
+                return result
+            
+            result = func(*args, **kwargs)
+            if 'error' not in result:
+                analysis_cache.set(key, result)
+            return result
+        return wrapper
+    return decorator
+
+
+def _off_loop(func):
+    """
+    Wraps a blocking analysis function as a coroutine for FunctionTool.
+    
+    ADK calls sync tool functions directly on the event loop, which would
+    stall the other agent's tool calls and Gemini turns while Whisper or
+    frame decoding runs. The wrapper runs func on a worker thread instead.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(func, *args, **kwargs)
+    return wrapper
+
+
+# ============================================================================
+# SHARED MEDIA DECODING
+# ============================================================================
+
+AUDIO_SAMPLE_RATE = 16000
+
+# In-flight or finished decodes shared by the vision and voice tools,
+# keyed by resolved file path (tools get whatever path the LLM wrote),
+# then by 'frames' / 'audio'
+_decoded_media = {}
+_media_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="media-decode")
+
+
+def _stacked_frames(video_path: str):
+    """Sampled frames as one contiguous (N, H, W, 3) uint8 array, or None."""
+    frames = _sample_frames(video_path)
+    return np.stack(frames) if frames else None
+
+
+def preprocess_media(video_path: str) -> dict:
+    """
+    Starts decoding a video's sampled frames and 16kHz mono audio.
+    
+    Returns immediately; decoding runs on background threads so it
+    overlaps with the agents' first Gemini turns. Vision and voice tools
+    are called with the same path and wait on these shared buffers instead
+    of each re-opening the container. Only the parts whose analysis is
+    not already cached are decoded.
+    
+    Args:
+        video_path: Path to the video file
+        
+    Returns:
+        Dictionary of futures for 'frames' and/or 'audio' (empty if
+        nothing needed decoding)
+    """
+    key = _file_key(video_path)
+    media = {}
+    if _cache_key('vision_analyze', key) not in analysis_cache:
+        media['frames'] = _media_pool.submit(_stacked_frames, video_path)
+    if _cache_key('voice_analyze', key) not in analysis_cache:
+        media['audio'] = _media_pool.submit(
+            decode_audio, video_path, sampling_rate=AUDIO_SAMPLE_RATE
+        )
+    
+    if media:
+        _decoded_media[os.path.realpath(video_path)] = media
+    return media
+
+
+def _shared_media(path: str, kind: str):
+    """
+    Waits for a preprocessed 'frames' or 'audio' buffer.
+    
+    Returns None when no preprocessing was started for path or it failed,
+    in which case the caller decodes on its own.
+    """
+    future = _decoded_media.get(os.path.realpath(path), {}).get(kind)
+    if future is None:
+        return None
+    try:
+        return future.result()
+    except Exception as e:
+        print(f"Shared {kind} decode failed, decoding again: {e}")
+        return None
+
+
+def release_media(video_path: str) -> None:
+    """Drops the shared decoded buffers for a video."""
+    media = _decoded_media.pop(os.path.realpath(video_path), {})
+    for future in media.values():
+        future.cancel()
 
 
 # ============================================================================
 # VISION ANALYSIS TOOL
 # ============================================================================
 
+# Column order of the per-frame vision metrics array
+VISION_METRICS = ('joy', 'sorrow', 'surprise', 'eye_contact', 'smile')
+
+
+def _sample_frames(video_path: str, num_frames: int = 20) -> list:
+    """
+    Decodes frames spread evenly across the video by seeking to them.
+    
+    Seeking means only the sampled frames (plus the nearest keyframe
+    before each) are decoded, rather than every frame in the file.
+    
+    Args:
+        video_path: Path to the video file
+        num_frames: Number of frames to sample
+        
+    Returns:
+        List of BGR frames as numpy arrays
+    """
+    # Prefer FFmpeg with hardware-accelerated decoding where available
+    cap = cv2.VideoCapture(
+        video_path,
+        cv2.CAP_FFMPEG,
+        [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+    )
+    if not cap.isOpened():
+        cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        raise ValueError(f"Could not open video: {video_path}")
+    
+    frames = []
+    try:
+        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        
+        if total_frames <= 0:
+            # Frame count unknown (e.g. some streams): read from the start
+            while len(frames) < num_frames:
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                frames.append(frame)
+            return frames
+        
+        targets = np.linspace(
+            0, total_frames - 1, num=min(num_frames, total_frames)
+        ).astype(int)
+        
+        for target in targets:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, int(target))
+            ret, frame = cap.read()
+            if ret:
+                frames.append(frame)
+    finally:
+        cap.release()
+    
+    return frames
+
+
+@cached_analysis(_file_key)
 def vision_analyze(video_path: str) -> dict:
     """
     Analyzes facial expressions and non-verbal communication from video.
@@ -43,60 +378,41 @@ def vision_analyze(video_path: str) -> dict:
         - smile_ratio: Proportion of frames with smiling
     """
     try:
-        cap = cv2.VideoCapture(video_path)
-        if not cap.isOpened():
-            raise ValueError(f"Could not open video: {video_path}")
-        
-        # Sample frames evenly throughout video
-        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        sample_interval = max(1, total_frames // 20)
-        
-        frames = []
-        frame_count = 0
-        
-        while cap.isOpened() and len(frames) < 20:
-            ret, frame = cap.read()
-            if not ret:
-                break
-            if frame_count % sample_interval == 0:
-                frames.append(frame)
-            frame_count += 1
-        
-        cap.release()
-        
-        if not frames:
-            raise ValueError("No frames could be extracted from video")
+        frames = _shared_media(video_path, 'frames')
+        if frames is None:
+            frames = _sample_frames(video_path)
+            if not frames:
+                raise ValueError("No frames could be extracted from video")
+            
+            # Stack into one contiguous (N, H, W, 3) uint8 buffer
+            frames = np.stack(frames)
         
-        # Initialize metrics
-        expressions = {'joy': 0, 'sorrow': 0, 'surprise': 0}
-        eye_contact = 0
-        smile_ratio = 0
+        num_frames = len(frames)
         head_nods = 0
         
-        # Analyze each frame
-        for frame in frames:
-            # Convert BGR to RGB for emotion pipeline
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            
-            # For now, we analyze the text sentiment as proxy
-            # In production, use proper face detection + emotion recognition
-            # emotion_result = emotion_pipeline(rgb_frame)[0]
-            
-            # Placeholder metrics (replace with actual face detection)
-            expressions['joy'] += 0.6
-            expressions['sorrow'] += 0.1
-            expressions['surprise'] += 0.2
-            eye_contact += 0.75  # Proxy based on face detection
-            smile_ratio += 0.5
+        # Real per-frame scores need face detection plus an image emotion
+        # model, neither of which exists in this tree (EMOTION_MODEL is a
+        # text classifier), so the metrics below are placeholders. Frames
+        # are already stacked so such a model could score them in one batch.
         
-        num_frames = len(frames)
+        # Per-frame metrics, one row per frame in VISION_METRICS order
+        metrics = np.empty((num_frames, len(VISION_METRICS)), np.float32)
+        for i in range(num_frames):
+            # Placeholder metrics (replace with actual face detection);
+            # eye contact is a proxy based on face detection
+            metrics[i] = (0.6, 0.1, 0.2, 0.75, 0.5)
+        
+        # Aggregate metrics across the batch in a single reduction
+        means = metrics.mean(axis=0, dtype=np.float64).round(2)
+        means = dict(zip(VISION_METRICS, means.tolist()))
         
-        # Normalize metrics
         return {
-            'expressions': {k: round(v / num_frames, 2) for k, v in expressions.items()},
-            'eye_contact_proxy': round(eye_contact / num_frames, 2),
+            'expressions': {
+                k: means[k] for k in ('joy', 'sorrow', 'surprise')
+            },
+            'eye_contact_proxy': means['eye_contact'],
             'head_nods': head_nods,
-            'smile_ratio': round(smile_ratio / num_frames, 2),
+            'smile_ratio': means['smile'],
             'frames_analyzed': num_frames
         }
         
@@ -111,9 +427,9 @@ def vision_analyze(video_path: str) -> dict:
         }
 
 
-# Wrap as ADK FunctionTool
+# Wrap as ADK FunctionTool (runs off the event loop)
 vision_tool = FunctionTool.from_function(
-    vision_analyze,
+    _off_loop(vision_analyze),
     name="vision_analyze",
     description="Analyzes facial expressions and non-verbal cues from video"
 )
@@ -123,6 +439,11 @@ vision_tool = FunctionTool.from_function(
 # VOICE ANALYSIS TOOL
 # ============================================================================
 
+# Spoken fillers, matched on word boundaries in a single pass
+VOICE_FILLER_RE = re.compile(r'\b(uh|um|like|you know|actually|basically)\b')
+
+
+@cached_analysis(_file_key)
 def voice_analyze(audio_path: str) -> dict:
     """
     Transcribes audio and analyzes vocal delivery characteristics.
@@ -139,32 +460,47 @@ def voice_analyze(audio_path: str) -> dict:
         - fillers: Count of filler words (um, uh, like)
     """
     try:
-        # Transcribe with Whisper
+        # Decode once to 16kHz mono float32; shared by Whisper and prosody
+        sr = AUDIO_SAMPLE_RATE
+        y = _shared_media(audio_path, 'audio')
+        if y is None:
+            y = decode_audio(audio_path, sampling_rate=sr)
+        
+        # Transcribe with Whisper (segments are yielded lazily). Each segment
+        # is handed to the language stream as soon as it is decoded, so
+        # sentence splitting and sentiment overlap with transcription
         print("Transcribing audio...")
-        result = whisper_model.transcribe(audio_path, fp16=False)
-        transcript = result['text']
+        segments, info = _whisper_model().transcribe(y, vad_filter=True)
+        text_queue, language_future = _start_language_stream()
+        parts = []
+        try:
+            for seg in segments:
+                parts.append(seg.text.strip())
+                text_queue.put(parts[-1])
+        finally:
+            text_queue.put(None)
+        transcript = " ".join(parts)
+        _track_language_stream(transcript, language_future)
         
         # Calculate speaking rate (WPM)
         words = transcript.split()
-        duration = result['segments'][-1]['end'] if result['segments'] else 1
+        duration = info.duration
         wpm = len(words) / (duration / 60) if duration > 0 else 0
         
-        # Load audio for prosody analysis
-        y, sr = librosa.load(audio_path, sr=None)
-        
-        # Pitch analysis (fundamental frequency)
-        pitches = librosa.yin(y, fmin=75, fmax=300, sr=sr)
-        pitch = np.nanmean(pitches[pitches > 0]) if len(pitches) > 0 else 150
+        # Pitch analysis (fundamental frequency, vectorized in torchaudio)
+        pitches = torchaudio.functional.detect_pitch_frequency(
+            torch.from_numpy(y), sr, frame_time=0.01, win_length=30,
+            freq_low=75, freq_high=300
+        )
+        voiced = pitches[(pitches >= 75) & (pitches <= 300)]
+        pitch = voiced.mean().item() if voiced.numel() > 0 else 150
         
         # Energy analysis (RMS)
         rms = librosa.feature.rms(y=y)
         energy = float(np.mean(rms))
         
         # Count filler words
-        filler_words = ['uh', 'um', 'like', 'you know', 'actually', 'basically']
-        fillers = sum(
-            transcript.lower().count(filler) for filler in filler_words
-        )
+        fillers = sum(1 for _ in VOICE_FILLER_RE.finditer(transcript.lower()))
         
         return {
             'transcript': transcript,
@@ -188,9 +524,9 @@ def voice_analyze(audio_path: str) -> dict:
         }
 
 
-# Wrap as ADK FunctionTool
+# Wrap as ADK FunctionTool (runs off the event loop)
 voice_tool = FunctionTool.from_function(
-    voice_analyze,
+    _off_loop(voice_analyze),
     name="voice_analyze",
     description="Transcribes audio and analyzes speaking rate, pitch, energy, and fillers"
 )
@@ -200,6 +536,119 @@ voice_tool = FunctionTool.from_function(
 # LANGUAGE ANALYSIS TOOL
 # ============================================================================
 
+# Verbal fillers and hedges, compiled once rather than per call
+FILLER_RE = re.compile(
+    r'\b(uh|um|like|you know|actually|basically|sort of|kind of)\b'
+)
+WORD_RE = re.compile(r'[a-z]+')
+
+# Transcripts longer than this are windowed before language analysis
+CONTEXT_WINDOW_TOKENS = 2000
+
+
+def compact(text: str, max_tokens: int = CONTEXT_WINDOW_TOKENS) -> str:
+    """
+    Sliding-window context compaction (strategy="sliding_window").
+    
+    Keeps the last max_tokens whitespace-delimited tokens verbatim. This
+    replaces LLM-summary compaction: it costs a slice instead of an extra
+    model round-trip, and never paraphrases away numbers.
+    
+    Args:
+        text: Free text to compact (e.g. a transcript)
+        max_tokens: Maximum number of tokens to keep
+        
+    Returns:
+        The text unchanged if short enough, otherwise its trailing window
+    """
+    tokens = text.split()
+    if len(tokens) <= max_tokens:
+        return text
+    return " ".join(tokens[-max_tokens:])
+
+
+def _classify(classifier, text: str) -> dict:
+    """
+    Scores text with a classifier's fast tokenizer and model directly.
+    
+    Tokenizes once into tensors and runs a single forward pass, skipping
+    the per-call preprocessing and postprocessing of pipeline().
+    
+    Args:
+        classifier: Loaded text-classification pipeline
+        text: Text to classify
+        
+    Returns:
+        Dictionary with the top 'label' and its 'score'
+    """
+    enc = classifier.tokenizer(
+        [text], truncation=True, padding=True, return_tensors="pt"
+    ).to(classifier.device)
+    with torch.inference_mode():
+        probs = classifier.model(**enc).logits.softmax(dim=-1)[0]
+    idx = int(probs.argmax())
+    return {
+        'label': classifier.model.config.id2label[idx],
+        'score': float(probs[idx])
+    }
+
+
+def _sentence_size(sentence) -> tuple:
+    """(token count, word count) of a spaCy sentence span."""
+    return len(sentence), len(sentence.text.split())
+
+
+def _language_metrics(
+    transcript: str,
+    sentence_sizes: list,
+    sentiment_result: dict
+) -> dict:
+    """
+    Builds the language_analyze result from precomputed pieces.
+    
+    Args:
+        transcript: Full transcript text
+        sentence_sizes: (token count, word count) per sentence
+        sentiment_result: Top sentiment 'label' and 'score'
+    """
+    lowered = transcript.lower()
+    
+    # Grammar score (proxy: well-formed sentences)
+    well_formed = [n for n, _ in sentence_sizes if n > 5]
+    grammar_score = len(well_formed) / max(1, len(sentence_sizes))
+    
+    confidence = (
+        sentiment_result['score'] 
+        if sentiment_result['label'] == 'POSITIVE' 
+        else 1 - sentiment_result['score']
+    )
+    
+    # Count filler words
+    fillers = sum(1 for _ in FILLER_RE.finditer(lowered))
+    
+    # Sentence statistics
+    sentence_lengths = [words for _, words in sentence_sizes]
+    avg_sentence_length = (
+        sum(sentence_lengths) / len(sentence_lengths) 
+        if sentence_lengths else 0
+    )
+    
+    # Vocabulary diversity (unique words / total words)
+    words = WORD_RE.findall(lowered)
+    vocab_diversity = len(set(words)) / len(words) if words else 0
+    
+    return {
+        'grammar_score': round(grammar_score, 2),
+        'confidence': round(confidence, 2),
+        'filler_words': fillers,
+        'sentence_count': len(sentence_sizes),
+        'avg_sentence_length': round(avg_sentence_length, 1),
+        'vocab_diversity': round(vocab_diversity, 2),
+        'sentiment_label': sentiment_result['label']
+    }
+
+
+@cached_analysis(_text_key)
 def language_analyze(transcript: str) -> dict:
     """
     Analyzes language patterns, grammar, and sentiment from transcript.
@@ -219,46 +668,26 @@ def language_analyze(transcript: str) -> dict:
         if not transcript or len(transcript.strip()) == 0:
             raise ValueError("Empty transcript provided")
         
-        # Parse with spaCy
-        doc = nlp(transcript)
-        sentences = list(doc.sents)
-        
-        # Grammar score (proxy: well-formed sentences)
-        well_formed = [s for s in sentences if len(s) > 5]
-        grammar_score = len(well_formed) / max(1, len(sentences))
-        
-        # Sentiment analysis for confidence
-        sentiment_result = pipeline("sentiment-analysis")(transcript[:512])[0]
-        confidence = (
-            sentiment_result['score'] 
-            if sentiment_result['label'] == 'POSITIVE' 
-            else 1 - sentiment_result['score']
-        )
-        
-        # Count filler words
-        filler_pattern = r'\b(uh|um|like|you know|actually|basically|sort of|kind of)\b'
-        fillers = len(re.findall(filler_pattern, transcript.lower()))
+        streamed = _pending_language.get(_text_key(transcript))
+        if streamed is not None:
+            # Already analyzed incrementally while Whisper was transcribing
+            try:
+                _, sentence_sizes, sentiment_result = streamed.result()
+            except Exception as e:
+                print(f"Streamed language analysis failed, redoing: {e}")
+                streamed = None
         
-        # Sentence statistics
-        sentence_lengths = [len(s.text.split()) for s in sentences]
-        avg_sentence_length = (
-            sum(sentence_lengths) / len(sentence_lengths) 
-            if sentence_lengths else 0
-        )
+        if streamed is None:
+            # Split sentences with spaCy (sentencizer only)
+            doc = _nlp()(transcript)
+            sentence_sizes = [_sentence_size(s) for s in doc.sents]
+            
+            # Sentiment analysis for confidence
+            sentiment_result = _classify(
+                _sentiment_pipeline(), transcript[:512]
+            )
         
-        # Vocabulary diversity (unique words / total words)
-        words = [token.text.lower() for token in doc if token.is_alpha]
-        vocab_diversity = len(set(words)) / len(words) if words else 0
-        
-        return {
-            'grammar_score': round(grammar_score, 2),
-            'confidence': round(confidence, 2),
-            'filler_words': fillers,
-            'sentence_count': len(sentences),
-            'avg_sentence_length': round(avg_sentence_length, 1),
-            'vocab_diversity': round(vocab_diversity, 2),
-            'sentiment_label': sentiment_result['label']
-        }
+        return _language_metrics(transcript, sentence_sizes, sentiment_result)
         
     except Exception as e:
         print(f"Language analysis error: {e}")
@@ -272,14 +701,123 @@ def language_analyze(transcript: str) -> dict:
         }
 
 
-# Wrap as ADK FunctionTool
+# Wrap as ADK FunctionTool (runs off the event loop)
 language_tool = FunctionTool.from_function(
-    language_analyze,
+    _off_loop(language_analyze),
     name="language_analyze",
     description="Analyzes grammar, sentiment, and linguistic patterns from transcript"
 )
 
 
+# ============================================================================
+# STREAMING LANGUAGE ANALYSIS
+# ============================================================================
+
+# Language analyses still being fed by an in-progress transcription,
+# keyed by the final transcript's content key
+_pending_language = {}
+_language_stream = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="language-stream"
+)
+
+
+def _consume_transcript(text_queue: queue.Queue) -> tuple:
+    """
+    Consumes transcript segments until a None sentinel arrives.
+    
+    Sentences are split as segments arrive; the last sentence of each
+    chunk is held back since the next segment may continue it. Sentiment
+    only reads the first 512 characters, so it runs as soon as they exist.
+    
+    The result describes compact(transcript), the same window the language
+    agent receives. Once the transcript outgrows the window, incremental
+    work is abandoned and the window is analyzed when the stream ends.
+    
+    Returns:
+        (windowed transcript, sentence_sizes, sentiment_result)
+    """
+    nlp = _nlp()
+    parts = []
+    sentence_sizes = []
+    carry = ""
+    sentiment_result = None
+    num_tokens = 0
+    
+    while True:
+        text = text_queue.get()
+        if text is None:
+            break
+        parts.append(text)
+        num_tokens += len(text.split())
+        if num_tokens > CONTEXT_WINDOW_TOKENS:
+            continue
+        
+        if sentiment_result is None:
+            head = " ".join(parts)
+            if len(head) >= 512:
+                sentiment_result = _classify(_sentiment_pipeline(), head[:512])
+        
+        sentences = list(nlp(f"{carry} {text}" if carry else text).sents)
+        sentence_sizes.extend(_sentence_size(s) for s in sentences[:-1])
+        carry = sentences[-1].text if sentences else ""
+    
+    transcript = " ".join(parts)
+    
+    if num_tokens > CONTEXT_WINDOW_TOKENS:
+        window = compact(transcript)
+        sentence_sizes = [_sentence_size(s) for s in nlp(window).sents]
+        sentiment_result = _classify(_sentiment_pipeline(), window[:512])
+        return window, sentence_sizes, sentiment_result
+    
+    if carry:
+        sentence_sizes.extend(_sentence_size(s) for s in nlp(carry).sents)
+    if sentiment_result is None:
+        sentiment_result = _classify(_sentiment_pipeline(), transcript[:512])
+    
+    return transcript, sentence_sizes, sentiment_result
+
+
+def _start_language_stream() -> tuple:
+    """
+    Starts a language analysis consumer for an upcoming transcription.
+    
+    Returns:
+        (queue to put segment texts on, terminated by None; result future)
+    """
+    text_queue = queue.Queue()
+    return text_queue, _language_stream.submit(_consume_transcript, text_queue)
+
+
+def _track_language_stream(transcript: str, future) -> None:
+    """
+    Makes a streamed analysis visible to language_analyze for transcript.
+    
+    Keyed on compact(transcript), which is what the language agent passes
+    to language_analyze. Calls that arrive while the stream is finishing
+    wait on it; once done, the result is written to the analysis cache
+    like any other run.
+    """
+    if not transcript.strip():
+        return
+    
+    key = _text_key(compact(transcript))
+    _pending_language[key] = future
+    
+    def store(done):
+        try:
+            transcript_, sentence_sizes, sentiment_result = done.result()
+            analysis_cache.set(
+                _cache_key('language_analyze', key),
+                _language_metrics(transcript_, sentence_sizes, sentiment_result)
+            )
+        except Exception as e:
+            print(f"Streaming language analysis error: {e}")
+        finally:
+            _pending_language.pop(key, None)
+    
+    future.add_done_callback(store)
+
+
 # ============================================================================
 # EXPORT ALL TOOLS
 # ============================================================================